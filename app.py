@@ -4,38 +4,127 @@ Streamlit entry point for NeuroGraph.
 Features:
 - Sidebar connection status (Neo4j, Ollama).
 - Drag & drop area for documents (PDF/PPTX).
-- Live log panel showing ingestion progress.
+- Live log panel showing ingestion progress (ingestion runs in a
+  background thread; logs reach the script thread through a queue).
 """
 
 from __future__ import annotations
 
 import logging
+import queue
+import shutil
 import tempfile
+import threading
+import time
+from collections import deque
+from logging.handlers import QueueHandler
 from pathlib import Path
-from typing import List, Tuple
+from typing import Deque, Optional, Tuple
 
 import streamlit as st
 from streamlit.delta_generator import DeltaGenerator
 
 from src.core.config import OLLAMA_BASE_URL
 from src.graph.db_connector import graph_db
+from src.ingestion.bibliographer import http_session
 from src.ingestion.pipeline import ingestor
 
 
 class StreamlitLogHandler(logging.Handler):
-    """Capture logs and stream them into a Streamlit placeholder."""
-
-    def __init__(self, placeholder: DeltaGenerator) -> None:
+    """
+    Capture logs and stream them into a Streamlit placeholder.
+
+    Keeps only the last `max_lines` records and redraws the placeholder at
+    most once every `min_interval` seconds; call `flush()` to force a redraw.
+    """
+
+    def __init__(
+        self,
+        placeholder: DeltaGenerator,
+        max_lines: int = 2000,
+        min_interval: float = 0.2,
+    ) -> None:
         super().__init__()
         self.placeholder = placeholder
-        self.lines: List[str] = []
+        self.lines: Deque[str] = deque(maxlen=max_lines)
+        self.min_interval = min_interval
+        self._last_flush = 0.0
 
     def emit(self, record: logging.LogRecord) -> None:
-        msg = self.format(record)
-        self.lines.append(msg)
+        self.lines.append(self.format(record))
+        if time.monotonic() - self._last_flush >= self.min_interval:
+            self.flush()
+
+    def flush(self) -> None:
         self.placeholder.text("\n".join(self.lines))
+        self._last_flush = time.monotonic()
+
+
+INGEST_LOGGERS = ("src.ingestion.pipeline", "src.graph.db_connector")
+
+
+class IngestionJob:
+    """
+    Run `ingestor.process_document` in a daemon thread.
+
+    Streamlit APIs must only be called from the script thread, so the worker
+    logs into a `QueueHandler`; `drain()` empties the queue from the script
+    and renders records through a `StreamlitLogHandler`. The job lives in
+    `st.session_state`: each script run drains, then schedules a rerun, so
+    the script never blocks on the ingestion and clicks stay responsive.
+    """
+
+    def __init__(self, path: Path, view: StreamlitLogHandler) -> None:
+        self.path = path
+        self.view = view
+        self.error: Optional[BaseException] = None
+        self._records: queue.Queue[logging.LogRecord] = queue.Queue()
+        self._queue_handler = QueueHandler(self._records)
+        self._thread = threading.Thread(
+            target=self._run, name="ingestion", daemon=True
+        )
+
+    def start(self) -> None:
+        for name in INGEST_LOGGERS:
+            lg = logging.getLogger(name)
+            lg.setLevel(logging.INFO)
+            lg.addHandler(self._queue_handler)
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self) -> None:
+        try:
+            ingestor.process_document(str(self.path))
+        except Exception as exc:  # pragma: no cover - runtime path
+            self.error = exc
+        finally:
+            for name in INGEST_LOGGERS:
+                logging.getLogger(name).removeHandler(self._queue_handler)
 
+    def drain(self, placeholder: DeltaGenerator) -> bool:
+        """Render the queued log records without blocking; True once finished."""
+        self.view.placeholder = placeholder
+        # Letto prima di svuotare la coda: nessun record finale va perso
+        finished = not self._thread.is_alive()
+        while True:
+            try:
+                record = self._records.get_nowait()
+            except queue.Empty:
+                break
+            self.view.handle(record)
+        self.view.flush()
+        return finished
 
+
+JOB_POLL_INTERVAL = 0.5  # secondi tra due aggiornamenti del log
+
+
+STATUS_CACHE_TTL = 15  # secondi tra due controlli di connessione
+
+
+@st.cache_data(ttl=STATUS_CACHE_TTL, show_spinner=False)
 def check_neo4j() -> Tuple[bool, str]:
     try:
         ok = graph_db.test_connection()
@@ -44,24 +133,31 @@ def check_neo4j() -> Tuple[bool, str]:
         return False, str(exc)
 
 
+@st.cache_data(ttl=STATUS_CACHE_TTL, show_spinner=False)
 def check_ollama() -> Tuple[bool, str]:
+    if http_session is None:
+        return False, "requests non installato"
     try:
-        import requests  # type: ignore[import-not-found]
-
-        resp = requests.get(OLLAMA_BASE_URL, timeout=3)
+        # HEAD su /api/tags: nessun corpo JSON da trasferire
+        resp = http_session.head(f"{OLLAMA_BASE_URL.rstrip('/')}/api/tags", timeout=3)
         return resp.ok, f"HTTP {resp.status_code}"
     except Exception as exc:
         return False, str(exc)
 
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
 def save_uploaded_file(uploaded_file) -> Path:
     uploads_dir = Path("data/uploads")
     uploads_dir.mkdir(parents=True, exist_ok=True)
     suffix = Path(uploaded_file.name).suffix
     with tempfile.NamedTemporaryFile(
-        delete=False, suffix=suffix, dir=uploads_dir
+        delete=False, suffix=suffix, dir=uploads_dir, buffering=UPLOAD_CHUNK_SIZE
     ) as tmp:
-        tmp.write(uploaded_file.getbuffer())
+        # Copia a blocchi: evita una seconda copia completa dell'upload in RAM
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, tmp, length=UPLOAD_CHUNK_SIZE)
         return Path(tmp.name)
 
 
@@ -76,6 +172,8 @@ def main() -> None:
     st.sidebar.write(f"Neo4j: {'🟢' if neo_status else '🔴'} {neo_msg}")
     st.sidebar.write(f"Ollama: {'🟢' if ollama_status else '🔴'} {ollama_msg}")
     if st.sidebar.button("Ricarica stato"):
+        check_neo4j.clear()
+        check_ollama.clear()
         st.rerun()
 
     st.markdown(
@@ -97,27 +195,30 @@ def main() -> None:
             st.error("Formato non supportato. Usa PDF o PPTX.")
             return
 
-        saved_path = save_uploaded_file(uploaded)
-        st.info(f"File caricato: {saved_path.name}")
-
-        handler = StreamlitLogHandler(log_placeholder)
-        handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
-        target_loggers = [
-            logging.getLogger("src.ingestion.pipeline"),
-            logging.getLogger("src.graph.db_connector"),
-        ]
-        for lg in target_loggers:
-            lg.setLevel(logging.INFO)
-            lg.addHandler(handler)
-
-        try:
-            ingestor.process_document(str(saved_path))
+        job = st.session_state.get("ingest_job")
+        if job is not None and job.is_alive():
+            st.warning("Un'ingestion è già in corso.")
+        else:
+            saved_path = save_uploaded_file(uploaded)
+            st.info(f"File caricato: {saved_path.name}")
+
+            view = StreamlitLogHandler(log_placeholder)
+            view.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+            job = IngestionJob(saved_path, view)
+            job.start()
+            st.session_state["ingest_job"] = job
+
+    job = st.session_state.get("ingest_job")
+    if job is not None:
+        if not job.drain(log_placeholder):
+            st.info(f"⏳ Ingestion in corso: {job.path.name}")
+            time.sleep(JOB_POLL_INTERVAL)
+            st.rerun()
+        del st.session_state["ingest_job"]
+        if job.error is not None:
+            st.error(f"Errore durante l'ingestion: {job.error}")
+        else:
             st.success("Ingestion completata.")
-        except Exception as exc:  # pragma: no cover - runtime path
-            st.error(f"Errore durante l'ingestion: {exc}")
-        finally:
-            for lg in target_loggers:
-                lg.removeHandler(handler)
 
 
 if __name__ == "__main__":
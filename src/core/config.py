@@ -62,6 +62,12 @@ CLASSIFICATION_MODEL = os.getenv(
     "CLASSIFICATION_MODEL", "llama3.1:8b-instruct-fp16"
 )  # CPU, quick classification/cleanup
 
+# Richieste concorrenti verso Ollama (allineare all'omonima variabile del server)
+OLLAMA_NUM_PARALLEL = max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+# Tempo di permanenza in memoria dei modelli tra una richiesta e l'altra
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+OLLAMA_REQUEST_TIMEOUT = float(os.getenv("OLLAMA_REQUEST_TIMEOUT", "120"))  # secondi
+
 OLLAMA_MODELS = {
     "vision": VISION_MODEL,
     "embedding": EMBEDDING_MODEL,
@@ -97,6 +103,9 @@ __all__ = [
     "REASONING_MODEL",
     "CLASSIFICATION_MODEL",
     "OLLAMA_MODELS",
+    "OLLAMA_NUM_PARALLEL",
+    "OLLAMA_KEEP_ALIVE",
+    "OLLAMA_REQUEST_TIMEOUT",
     "NEO4J_URI",
     "NEO4J_USERNAME",
     "NEO4J_PASSWORD",
@@ -0,0 +1,38 @@
+"""
+JSON encode/decode helpers with an optional fast backend.
+
+Uses orjson (C implementation) when installed and falls back to the
+standard library `json` module otherwise. Decode errors are always
+instances of `json.JSONDecodeError`, whichever backend is active.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document from str or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode `obj` as a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
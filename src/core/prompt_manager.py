@@ -2,48 +2,87 @@
 Prompt management utilities.
 
 Loads system prompts from `prompts.json` and formats them with optional
-keyword arguments for runtime interpolation.
+keyword arguments for runtime interpolation. Every prompt is a `str.format`
+template: literal braces (e.g. JSON examples) are written as `{{` and `}}`,
+so use `format()` rather than `get()` to obtain the text sent to a model.
 """
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Mapping
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Tuple
+
+from src.core.json_codec import loads as json_loads
 
 
 DEFAULT_PROMPTS_PATH = Path(__file__).with_name("prompts.json")
 
 
+def _needs_format(template: str) -> bool:
+    """
+    Whether `str.format` can change the template.
+
+    Any brace counts: besides replacement fields, escaped `{{`/`}}` must be
+    collapsed and malformed braces must still raise at format time.
+    """
+    return "{" in template or "}" in template
+
+
+@lru_cache(maxsize=8)
+def _load_prompts_cached(
+    path: str, mtime_ns: int
+) -> Mapping[str, Tuple[str, bool]]:
+    """
+    Parse a prompts file once per (path, mtime) and precompute format flags.
+
+    The mtime is part of the cache key so edits to the file are picked up by
+    new `PromptManager` instances without restarting the process.
+    """
+    with open(path, "rb") as f:
+        raw = json_loads(f.read())
+
+    if not isinstance(raw, Mapping):
+        raise ValueError("Prompts file must contain a JSON object")
+
+    compiled: Dict[str, Tuple[str, bool]] = {}
+    for key, value in raw.items():
+        prompt = str(value)
+        compiled[str(key)] = (prompt, _needs_format(prompt))
+    return MappingProxyType(compiled)
+
+
 class PromptManager:
     def __init__(self, prompts_path: Path | str | None = None) -> None:
         self.prompts_path = Path(prompts_path) if prompts_path else DEFAULT_PROMPTS_PATH
-        self._prompts = self._load_prompts()
+        self._compiled = self._load_prompts()
 
-    def _load_prompts(self) -> Dict[str, str]:
+    def _load_prompts(self) -> Mapping[str, Tuple[str, bool]]:
         if not self.prompts_path.exists():
             raise FileNotFoundError(f"Prompts file not found: {self.prompts_path}")
 
-        with self.prompts_path.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
-
-        if not isinstance(raw, Mapping):
-            raise ValueError("Prompts file must contain a JSON object")
-
-        return {str(k): str(v) for k, v in raw.items()}
+        mtime_ns = self.prompts_path.stat().st_mtime_ns
+        return _load_prompts_cached(str(self.prompts_path.resolve()), mtime_ns)
 
     def available(self) -> Iterable[str]:
-        return self._prompts.keys()
+        return self._compiled.keys()
 
     def get(self, name: str) -> str:
         try:
-            return self._prompts[name]
+            return self._compiled[name][0]
         except KeyError as exc:
             raise KeyError(f"Prompt '{name}' not found") from exc
 
     def format(self, name: str, **kwargs) -> str:
         prompt = self.get(name)
-        return prompt.format(**kwargs) if kwargs else prompt
+        if not self._compiled[name][1]:
+            return prompt
+        return prompt.format(**kwargs)
+
+
+# Istanza globale (prompts.json di default)
+prompt_manager = PromptManager()
 
 
-__all__ = ["PromptManager", "DEFAULT_PROMPTS_PATH"]
+__all__ = ["PromptManager", "DEFAULT_PROMPTS_PATH", "prompt_manager"]
@@ -9,7 +9,9 @@ e gestisce il ciclo di vita della sessione.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, cast
+import threading
+from itertools import islice
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, cast
 
 from typing_extensions import LiteralString
 
@@ -23,45 +25,80 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Pool di connessioni condiviso da tutto il processo
+DRIVER_POOL_CONFIG: Dict[str, Any] = {
+    "max_connection_pool_size": 50,
+    "connection_acquisition_timeout": 30.0,
+    "max_connection_lifetime": 3600,
+    "connection_timeout": 5.0,
+    "keep_alive": True,
+}
+
+
+# Indice full-text usato dall'Explorer per la ricerca dei concetti
+CONCEPT_FULLTEXT_INDEX = "concept_name_fts"
+
+# Schema idempotente: MERGE su Concept.name diventa un lookup su indice
+SCHEMA_STATEMENTS: List[str] = [
+    "CREATE CONSTRAINT concept_name_unique IF NOT EXISTS "
+    "FOR (c:Concept) REQUIRE c.name IS UNIQUE",
+    "CREATE CONSTRAINT document_name_unique IF NOT EXISTS "
+    "FOR (d:Document) REQUIRE d.name IS UNIQUE",
+    f"CREATE FULLTEXT INDEX {CONCEPT_FULLTEXT_INDEX} IF NOT EXISTS "
+    "FOR (c:Concept) ON EACH [c.name]",
+]
+
+
 class Neo4jConnector:
     _instance: Optional[Neo4jConnector] = None
     _driver: Optional[Driver] = None
+    # RLock: connect() può essere chiamato mentre il lock è già acquisito
+    _lock: ClassVar[threading.RLock] = threading.RLock()
 
     def __new__(cls) -> Neo4jConnector:
-        """Implementazione Thread-safe del Singleton."""
+        """Implementazione Thread-safe del Singleton (double-checked locking)."""
         if cls._instance is None:
-            cls._instance = super(Neo4jConnector, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(Neo4jConnector, cls).__new__(cls)
         return cls._instance
 
     def __init__(self) -> None:
         """Inizializza il driver se non esiste già."""
         if self._driver is None:
-            self.connect()
+            with self._lock:
+                if self._driver is None:
+                    self.connect()
 
     def connect(self) -> Driver:
-        """Crea la connessione al database."""
-        try:
-            if not NEO4J_URI or not NEO4J_USERNAME or not NEO4J_PASSWORD:
-                raise ValueError("Credenziali Neo4j mancanti in .env o config.py")
-
-            self._driver = GraphDatabase.driver(
-                NEO4J_URI, auth=(NEO4J_USERNAME, NEO4J_PASSWORD)
-            )
-            # Verifica connettività immediata
-            self._driver.verify_connectivity()
-            logger.info(f"✅ Connesso con successo a Neo4j su {NEO4J_URI}")
-            return self._driver
-        except (ServiceUnavailable, AuthError) as e:
-            logger.error(f"❌ Errore di connessione a Neo4j: {e}")
-            raise e
-        except Exception as e:
-            logger.error(f"❌ Errore imprevisto Neo4j: {e}")
-            raise e
+        """Crea la connessione al database (serializzata dal lock di classe)."""
+        with self._lock:
+            try:
+                if not NEO4J_URI or not NEO4J_USERNAME or not NEO4J_PASSWORD:
+                    raise ValueError("Credenziali Neo4j mancanti in .env o config.py")
+
+                self._driver = GraphDatabase.driver(
+                    NEO4J_URI,
+                    auth=(NEO4J_USERNAME, NEO4J_PASSWORD),
+                    **DRIVER_POOL_CONFIG,
+                )
+                # Verifica connettività immediata
+                self._driver.verify_connectivity()
+                logger.info(f"✅ Connesso con successo a Neo4j su {NEO4J_URI}")
+                return self._driver
+            except (ServiceUnavailable, AuthError) as e:
+                logger.error(f"❌ Errore di connessione a Neo4j: {e}")
+                raise e
+            except Exception as e:
+                logger.error(f"❌ Errore imprevisto Neo4j: {e}")
+                raise e
 
     def _get_driver(self) -> Driver:
         """Restituisce un driver attivo o solleva se non disponibile."""
         if self._driver is None:
-            self.connect()
+            with self._lock:
+                if self._driver is None:
+                    self.connect()
         if self._driver is None:  # type: ignore[unreachable]
             raise RuntimeError("Driver Neo4j non disponibile")
         return self._driver
@@ -97,10 +134,73 @@ class Neo4jConnector:
             logger.error(f"Dettaglio: {e}")
             raise e
 
+    def bulk_write(
+        self,
+        cypher_query: str,
+        rows: Iterable[Dict[str, Any]],
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Esegue una query di scrittura `UNWIND $rows AS row ...` a blocchi.
+
+        Usa una sola sessione e una transazione (un commit) per blocco,
+        invece di un round-trip e un commit per riga.
+
+        Args:
+            cypher_query (str): Query che consuma il parametro `$rows`.
+            rows (Iterable[dict]): Le righe da scrivere.
+            parameters (dict): Parametri aggiuntivi comuni a tutti i blocchi.
+            batch_size (int): Numero massimo di righe per transazione.
+
+        Returns:
+            int: Numero di righe inviate al database.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size deve essere >= 1")
+
+        def _write(tx: Any, chunk: List[Dict[str, Any]]) -> None:
+            tx.run(
+                cast(LiteralString, cypher_query), {**(parameters or {}), "rows": chunk}
+            ).consume()
+
+        written = 0
+        iterator = iter(rows)
+        try:
+            driver = self._get_driver()
+            with driver.session() as session:
+                while chunk := list(islice(iterator, batch_size)):
+                    session.execute_write(_write, chunk)
+                    written += len(chunk)
+            return written
+        except Exception as e:
+            logger.error(f"❌ Errore scrittura bulk: {cypher_query}")
+            logger.error(f"Dettaglio: {e} (righe scritte: {written})")
+            raise e
+
+    def ensure_schema(self) -> bool:
+        """
+        Crea vincoli e indici in `SCHEMA_STATEMENTS` se mancanti.
+
+        Ogni istruzione è indipendente: un errore (es. nomi duplicati che
+        impediscono il vincolo di unicità) viene loggato senza bloccare le altre.
+
+        Returns:
+            bool: True se tutte le istruzioni sono andate a buon fine.
+        """
+        ok = True
+        for statement in SCHEMA_STATEMENTS:
+            try:
+                self.query(statement)
+            except Exception as e:
+                logger.warning(f"⚠️ Schema Neo4j non applicato ({statement}): {e}")
+                ok = False
+        return ok
+
     def test_connection(self) -> bool:
-        """Test rapido per verificare se il DB è raggiungibile."""
+        """Test rapido per verificare se il DB è raggiungibile (senza query Cypher)."""
         try:
-            self.query("RETURN 1 AS test")
+            self._get_driver().verify_connectivity()
             return True
         except Exception:
             return False
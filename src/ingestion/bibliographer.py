@@ -8,20 +8,99 @@ Trust is computed from:
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
-from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from src.core.json_codec import dumps as json_dumps, loads as json_loads
 
 logger = logging.getLogger(__name__)
 
 try:
     import requests  # type: ignore[import-not-found]
+    from requests.adapters import HTTPAdapter  # type: ignore[import-not-found]
+    from urllib3.util.retry import Retry  # type: ignore[import-not-found]
 except ImportError:  # pragma: no cover - optional dependency
     requests = None  # type: ignore[assignment]
 
 
+def _build_session() -> Any:
+    """
+    Crea una sessione HTTP condivisa con connessioni keep-alive in pool.
+
+    Le API esterne (https) usano retry con backoff; gli endpoint locali in
+    chiaro (es. Ollama) restano senza retry per non allungare gli health check.
+    """
+    if requests is None:
+        return None
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        ),
+    )
+    session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+    return session
+
+
+# Sessione condivisa dal processo (Semantic Scholar, OpenAlex, Ollama)
+http_session = _build_session()
+
+# Durata della cache dei lookup remoti (secondi); i fallimenti scadono prima
+LOOKUP_CACHE_TTL = 24 * 60 * 60
+NEGATIVE_CACHE_TTL = 10 * 60
+_MISSING = object()
+
+
+class _TTLCache:
+    """Cache LRU minimale con scadenza per voce, sicura tra thread."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Restituisce il valore in cache o `_MISSING` se assente/scaduto."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_citation_cache = _TTLCache(maxsize=4096)
+_openalex_cache = _TTLCache(maxsize=4096)
+_trust_cache = _TTLCache(maxsize=1024)
+
+# Lookup remoti in background (I/O-bound): si sovrappongono a LLM e Semantic Scholar
+_lookup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="biblio")
+
+
 DOC_TYPE_PROMPT = """Analizza il seguente testo (prime pagine del documento) e rispondi in JSON.
 Classifica il documento in una delle categorie: LAB_NOTE, TEXTBOOK, LECTURE_SLIDES, IMAGE_CAPTION, EXPERIMENTAL_STUDY, REVIEW_ARTICLE, POPULAR_SCIENCE, OTHER.
 Restituisci solo JSON: {{"doc_type": "...", "confidence": 0.0-1.0, "rationale": "breve motivo"}}.
@@ -39,28 +118,82 @@ DOC_TYPE_TRUST = {
     "POPULAR_SCIENCE": 0.60,
 }
 
+# Insiemi di doc_type già normalizzati in maiuscolo (vedi get_trust_score)
+_LAB_NOTE_TYPES = frozenset({"NOTE", "LAB_NOTE", "LABNOTE"})
+_PUBLISHED_TYPES = frozenset({"PAPER", "EXPERIMENTAL_STUDY", "REVIEW_ARTICLE"})
 
-def find_doi(text: str) -> Optional[str]:
-    """Estrai un DOI dal testo, se presente."""
-    match = re.search(r"10\.\d{4,9}/[^\s\"'>)]+", text, re.IGNORECASE)
-    if not match:
-        return None
-    doi = match.group(0).rstrip(".,;)")
-    return doi
+
+# Prefisso numerico "10.": IGNORECASE non serve e rallenterebbe la scansione
+_DOI_RE = re.compile(r"10\.\d{4,9}/[^\s\"'>)]+")
+_DOI_RE_BYTES = re.compile(rb"10\.\d{4,9}/[^\s\"'>)]+")
+DOI_SCAN_WINDOW = 32 * 1024
+
+
+def find_doi(text: str | bytes) -> Optional[str]:
+    """
+    Estrai un DOI dal testo (str o bytes grezzi), se presente.
+
+    I DOI stanno quasi sempre in prima pagina o in bibliografia: per testi
+    lunghi si cercano prima i primi e gli ultimi `DOI_SCAN_WINDOW` caratteri,
+    e solo in caso di insuccesso l'intero testo.
+    """
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        match = _search_doi(_DOI_RE_BYTES, text)
+        if not match:
+            return None
+        doi = bytes(match.group(0)).decode("utf-8", errors="replace")
+    else:
+        match = _search_doi(_DOI_RE, text)
+        if not match:
+            return None
+        doi = match.group(0)
+    return doi.rstrip(".,;)")
+
+
+def _search_doi(pattern: re.Pattern, text: Any) -> Optional[re.Match]:
+    size = len(text)
+    if size > 2 * DOI_SCAN_WINDOW:
+        head = pattern.search(text, 0, DOI_SCAN_WINDOW)
+        if head:
+            # Rimatch senza endpos: il DOI può sforare il bordo della finestra
+            return pattern.match(text, head.start())
+        tail = pattern.search(text, size - DOI_SCAN_WINDOW)
+        if tail:
+            return tail
+    return pattern.search(text)
 
 
 def fetch_citation_count(doi: str, timeout: float = 8.0) -> Optional[int]:
-    """Recupera il numero di citazioni via Semantic Scholar (se disponibile)."""
-    if requests is None:
+    """
+    Recupera il numero di citazioni via Semantic Scholar (se disponibile).
+
+    I risultati sono memorizzati per DOI: 24h se validi, 10 minuti se il lookup
+    fallisce, così un errore transitorio non resta in cache a lungo.
+    """
+    if http_session is None:
         logger.debug("requests non disponibile; salto lookup citazioni")
         return None
 
+    key = doi.strip().lower()
+    cached = _citation_cache.get(key)
+    if cached is not _MISSING:
+        return cached
+
+    count = _fetch_citation_count_remote(doi, timeout)
+    ttl = LOOKUP_CACHE_TTL if count is not None else NEGATIVE_CACHE_TTL
+    _citation_cache.set(key, count, ttl)
+    return count
+
+
+def _fetch_citation_count_remote(doi: str, timeout: float) -> Optional[int]:
     api_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
     headers = {"x-api-key": api_key} if api_key else {}
     url = f"https://api.semanticscholar.org/graph/v1/paper/DOI:{doi}"
     params = {"fields": "citationCount"}
     try:
-        resp = requests.get(url, params=params, headers=headers, timeout=timeout)
+        resp = http_session.get(
+            url, params=params, headers=headers, timeout=timeout
+        )
         resp.raise_for_status()
         data = resp.json()
         count = data.get("citationCount")
@@ -82,9 +215,9 @@ def _classify_document_type(
         response = classifier.invoke(prompt)
         raw_content: Any = getattr(response, "content", response)
         content_str = (
-            raw_content if isinstance(raw_content, str) else json.dumps(raw_content)
+            raw_content if isinstance(raw_content, str) else json_dumps(raw_content)
         )
-        data = json.loads(content_str)
+        data = json_loads(content_str)
         doc_type = str(data.get("doc_type") or data.get("type") or "OTHER").upper()
         confidence = float(data.get("confidence", 0.0))
         rationale = str(data.get("rationale", ""))
@@ -95,7 +228,8 @@ def _classify_document_type(
 
 
 def _trust_from_doc_type(doc_type: str) -> float:
-    return DOC_TYPE_TRUST.get(doc_type.upper(), 0.5)
+    """`doc_type` è già maiuscolo (normalizzato da _classify_document_type)."""
+    return DOC_TYPE_TRUST.get(doc_type, 0.5)
 
 
 def calculate_trust_score(
@@ -136,6 +270,7 @@ __all__ = [
     "calculate_trust_score",
     "find_doi",
     "fetch_citation_count",
+    "http_session",
 ]
 
 
@@ -159,32 +294,52 @@ class Bibliographer:
         """
         Calcola il punteggio di affidabilità (0.0 - 1.0) combinando
         euristiche locali e dati bibliometrici remoti.
+
+        Il risultato è in cache per (titolo, doc_type): a lungo se OpenAlex
+        ha risposto, per pochi minuti se si è ricaduti sull'euristica.
         """
-        base_score = 0.5
+        doc_type = doc_type_detected.upper()
 
         # 1. Gerarchia Locale (Priority Override)
-        if doc_type_detected.lower() in {"note", "lab_note", "labnote"}:
+        if doc_type in _LAB_NOTE_TYPES:
             return 1.0  # La verità sperimentale dell'utente vince sempre
 
+        key = (title.strip().lower(), doc_type)
+        cached = _trust_cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
         # 2. Validazione Bibliometrica (OpenAlex)
         alex_data = self._query_openalex(title)
         if alex_data:
-            citations = alex_data.get("cited_by_count", 0)
-            is_retracted = alex_data.get("is_retracted", False)
-
-            if is_retracted:
-                return 0.1  # Paper ritirato!
-
-            if citations > 100:
-                return 0.95
-            if citations > 10:
-                return 0.85
-            return 0.75  # Pubblicato ma poco citato
-
-        # 3. Fallback Euristico
-        if doc_type_detected.upper() in {"TEXTBOOK"}:
+            score = self._trust_from_openalex(alex_data)
+            _trust_cache.set(key, score, LOOKUP_CACHE_TTL)
+        else:
+            # 3. Fallback Euristico
+            score = self._trust_from_heuristics(doc_type)
+            _trust_cache.set(key, score, NEGATIVE_CACHE_TTL)
+        return score
+
+    @staticmethod
+    def _trust_from_openalex(alex_data: Dict) -> float:
+        citations = alex_data.get("cited_by_count", 0)
+        is_retracted = alex_data.get("is_retracted", False)
+
+        if is_retracted:
+            return 0.1  # Paper ritirato!
+
+        if citations > 100:
+            return 0.95
+        if citations > 10:
+            return 0.85
+        return 0.75  # Pubblicato ma poco citato
+
+    @staticmethod
+    def _trust_from_heuristics(doc_type: str) -> float:
+        base_score = 0.5
+        if doc_type == "TEXTBOOK":
             return 0.90
-        if doc_type_detected.upper() in {"PAPER", "EXPERIMENTAL_STUDY", "REVIEW_ARTICLE"}:
+        if doc_type in _PUBLISHED_TYPES:
             return 0.70
 
         return base_score
@@ -200,13 +355,36 @@ class Bibliographer:
         # Nota: l'implementazione reale richiederebbe reconciliation + pathfinding SPARQL
         return False
 
+    def prefetch_openalex(self, title: str) -> Future:
+        """
+        Avvia in background il lookup OpenAlex per `title`.
+
+        Il risultato finisce nella cache usata da `get_trust_score`: attendere
+        il Future prima di chiamarlo evita una seconda richiesta identica.
+        """
+        return _lookup_pool.submit(self._query_openalex, title)
+
     def _query_openalex(self, title: str) -> Optional[Dict]:
-        """Cerca il documento su OpenAlex per titolo."""
-        if requests is None:  # type: ignore[truthy-function]
+        """Cerca il documento su OpenAlex per titolo (con cache per titolo normalizzato)."""
+        if http_session is None:
             return None
+
+        key = title.strip().lower()
+        cached = _openalex_cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
+        result = self._query_openalex_remote(title)
+        ttl = LOOKUP_CACHE_TTL if result is not None else NEGATIVE_CACHE_TTL
+        _openalex_cache.set(key, result, ttl)
+        return result
+
+    def _query_openalex_remote(self, title: str) -> Optional[Dict]:
         try:
             params = {"search": title, "per_page": 1}
-            response = requests.get(self.openalex_url, params=params, headers=self.headers, timeout=3)
+            response = http_session.get(
+                self.openalex_url, params=params, headers=self.headers, timeout=3
+            )
             if response.status_code == 200:
                 results = response.json().get("results", [])
                 if results:
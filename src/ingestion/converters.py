@@ -3,22 +3,68 @@ Document conversion helpers for the ingestion pipeline.
 
 Functions:
 - convert_pptx_to_pdf: uses LibreOffice headless to convert PPTX to PDF.
+- convert_pptx_to_pdf_batch: converts several PPTX files in one LibreOffice run.
 - convert_epub_to_text: extracts readable text from an EPUB via ebooklib.
 - extract_images_from_pdf: saves large images from a PDF using PyMuPDF.
+- iter_pdf_page_texts: extracts page texts in order using a process pool.
 """
 
 from __future__ import annotations
 
 import logging
+import mmap
+import multiprocessing
+import os
+import signal
 import subprocess  # nosec B404
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 import fitz  # type: ignore[import-untyped]  # PyMuPDF
 
+try:
+    from selectolax.parser import HTMLParser as _FastHTMLParser  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    _FastHTMLParser = None
+
+try:
+    import lxml.html as _lxml_html  # type: ignore[import-not-found]
+    from lxml import etree as _lxml_etree  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    _lxml_html = None
+    _lxml_etree = None
+
 logger = logging.getLogger(__name__)
 
+# LibreOffice timeout per converted file (seconds)
+SOFFICE_TIMEOUT_PER_FILE = 120
+
+# Below this page count, starting worker processes costs more than decoding
+PARALLEL_MIN_PAGES = 4
+# get_text takes milliseconds per page: a process pool (fresh interpreters
+# that each reopen the PDF) only pays off for very long documents
+TEXT_PARALLEL_MIN_PAGES = 500
+# get_text is CPU-bound in MuPDF; gains flatten out beyond ~6 processes
+TEXT_MAX_WORKERS = 6
+
+# Worker processes are spawned, never forked: the pools are created from the
+# ingestion thread of a multi-threaded app, and a forked child can deadlock on
+# locks inherited from the other threads
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# PDFs larger than this are memory-mapped instead of read through stdio
+MMAP_MIN_BYTES = 256 * 1024 * 1024
+
+# Document opened once per worker process (see _init_pdf_worker);
+# _worker_release keeps any mmap alive for the lifetime of the worker
+_worker_doc: Any = None
+_worker_release: Optional[Callable[[], None]] = None
+
 
 class _HTMLStripper(HTMLParser):
     def __init__(self) -> None:
@@ -33,6 +79,89 @@ class _HTMLStripper(HTMLParser):
         return "\n".join(self._chunks)
 
 
+def _join_text_chunks(chunks) -> str:
+    return "\n".join(chunk.strip() for chunk in chunks if chunk.strip())
+
+
+def _html_to_text(content: bytes) -> str:
+    """
+    Convert an HTML document to plain text, one text block per line.
+
+    Uses selectolax (C) or lxml when installed; falls back to the pure-Python
+    `_HTMLStripper` otherwise.
+    """
+    if not content.strip():
+        return ""
+
+    if _FastHTMLParser is not None:
+        tree = _FastHTMLParser(content)
+        root = tree.body or tree.root
+        return _join_text_chunks(root.text(separator="\n").splitlines()) if root else ""
+
+    if _lxml_html is not None:
+        try:
+            root = _lxml_html.fromstring(content)
+        except _lxml_etree.ParserError:  # only comments/whitespace markup: no text
+            return ""
+        return _join_text_chunks(root.itertext())
+
+    stripper = _HTMLStripper()
+    stripper.feed(content.decode("utf-8", errors="ignore"))
+    return stripper.get_text()
+
+
+def _run_soffice_convert(inputs: List[Path], out_dir: Path) -> None:
+    """Run a single headless LibreOffice process converting `inputs` to PDF."""
+    cmd = [
+        "soffice",
+        "--headless",
+        "--convert-to",
+        "pdf",
+        "--outdir",
+        str(out_dir),
+        *(str(p) for p in inputs),
+    ]
+    timeout = SOFFICE_TIMEOUT_PER_FILE * len(inputs)
+
+    # stderr goes to a temp file: no PIPE deadlock, and it is only decoded on error
+    with tempfile.TemporaryFile() as err:
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=err,
+                shell=False,  # explicit for clarity/safety
+                start_new_session=True,  # soffice forks: kill its whole group
+            )  # nosec B603
+        except FileNotFoundError as exc:
+            raise RuntimeError("LibreOffice (soffice) non trovato nel PATH") from exc
+
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired as exc:
+            _kill_process_tree(proc)
+            raise RuntimeError(
+                f"Conversione PPTX->PDF interrotta dopo {timeout}s"
+            ) from exc
+
+        if returncode != 0:
+            err.seek(0)
+            stderr = err.read().decode(errors="ignore")
+            raise RuntimeError(f"Conversione PPTX->PDF fallita: {stderr}")
+
+
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    """Kill the process and its children (the whole process group on POSIX)."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:  # pragma: no cover - Windows
+            proc.kill()
+    except ProcessLookupError:
+        pass
+    proc.wait()
+
+
 def convert_pptx_to_pdf(path: str | Path, output_dir: Optional[Path] = None) -> Path:
     """
     Convert a PPTX file to PDF using LibreOffice (headless).
@@ -48,43 +177,53 @@ def convert_pptx_to_pdf(path: str | Path, output_dir: Optional[Path] = None) ->
         FileNotFoundError: if the PPTX does not exist.
         RuntimeError: if LibreOffice conversion fails or is missing.
     """
-    input_path = Path(path)
-    if not input_path.exists():
-        raise FileNotFoundError(f"File PPTX non trovato: {input_path}")
+    return convert_pptx_to_pdf_batch([path], output_dir)[0]
 
-    out_dir = output_dir or input_path.parent
+
+def convert_pptx_to_pdf_batch(
+    paths: List[str | Path], output_dir: Optional[Path] = None
+) -> List[Path]:
+    """
+    Convert several PPTX files to PDF with a single LibreOffice invocation.
+
+    LibreOffice startup dominates the cost of small conversions, so batching
+    pays it once. The timeout scales with the number of files.
+
+    Args:
+        paths: input PPTX paths.
+        output_dir: directory for the PDFs (defaults to the first file's folder).
+
+    Returns:
+        Paths to the generated PDFs, in input order.
+
+    Raises:
+        FileNotFoundError: if a PPTX does not exist.
+        ValueError: if two inputs would produce the same PDF name.
+        RuntimeError: if LibreOffice conversion fails, times out or is missing.
+    """
+    input_paths = [Path(p) for p in paths]
+    if not input_paths:
+        return []
+    for input_path in input_paths:
+        if not input_path.exists():
+            raise FileNotFoundError(f"File PPTX non trovato: {input_path}")
+
+    stems = [p.stem for p in input_paths]
+    if len(set(stems)) != len(stems):
+        raise ValueError("File PPTX con lo stesso nome: i PDF si sovrascriverebbero")
+
+    out_dir = output_dir or input_paths[0].parent
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    cmd = [
-        "soffice",
-        "--headless",
-        "--convert-to",
-        "pdf",
-        "--outdir",
-        str(out_dir),
-        str(input_path),
-    ]
+    _run_soffice_convert(input_paths, out_dir)
 
-    try:
-        subprocess.run(
-            cmd,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            shell=False,  # explicit for clarity/safety
-        )  # nosec B603
-    except FileNotFoundError as exc:
-        raise RuntimeError("LibreOffice (soffice) non trovato nel PATH") from exc
-    except subprocess.CalledProcessError as exc:
+    pdf_paths = [out_dir / f"{stem}.pdf" for stem in stems]
+    missing = [p.name for p in pdf_paths if not p.exists()]
+    if missing:
         raise RuntimeError(
-            f"Conversione PPTX->PDF fallita: {exc.stderr.decode(errors='ignore')}"
-        ) from exc
-
-    pdf_path = out_dir / f"{input_path.stem}.pdf"
-    if not pdf_path.exists():
-        raise RuntimeError("Conversione PPTX->PDF non ha prodotto il file atteso")
-    return pdf_path
+            f"Conversione PPTX->PDF non ha prodotto i file attesi: {', '.join(missing)}"
+        )
+    return pdf_paths
 
 
 def pptx_to_pdf_with_powerpoint(
@@ -150,35 +289,123 @@ def convert_epub_to_text(path: str | Path) -> str:
         if item.get_type() == getattr(
             epub, "ITEM_DOCUMENT", 9
         ):  # 9 is ITEM_DOCUMENT in ebooklib
-            stripper = _HTMLStripper()
             content_bytes: bytes = item.get_content()
-            try:
-                content_str = content_bytes.decode("utf-8", errors="ignore")
-            except Exception:
-                content_str = str(content_bytes)
-            stripper.feed(content_str)
-            text = stripper.get_text()
+            text = _html_to_text(content_bytes)
             if text:
                 segments.append(text)
 
     return "\n\n".join(segments)
 
 
+def _open_pdf_document(path: Path) -> Tuple[Any, Callable[[], None]]:
+    """
+    Open a PDF with PyMuPDF, memory-mapping it when larger than `MMAP_MIN_BYTES`.
+
+    Returns the document and a release callback that closes it and then the
+    mapping (the mapping must outlive the document).
+    """
+    if path.stat().st_size < MMAP_MIN_BYTES:
+        doc = fitz.open(str(path))  # type: ignore[attr-defined]
+        return doc, doc.close
+
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(buffer)
+    try:
+        doc = fitz.open(stream=view, filetype="pdf")  # type: ignore[attr-defined]
+    except Exception:
+        view.release()
+        buffer.close()
+        raise
+
+    def release() -> None:
+        doc.close()
+        view.release()
+        buffer.close()
+
+    return doc, release
+
+
+@contextmanager
+def open_pdf(path: str | Path) -> Iterator[Any]:
+    """
+    Context manager yielding a PyMuPDF document for `path`.
+
+    Large files are demand-paged through mmap so only the pages actually
+    touched are read from disk; small files use the regular stdio path.
+    """
+    doc, release = _open_pdf_document(Path(path))
+    try:
+        yield doc
+    finally:
+        release()
+
+
+def _save_page_images(
+    doc: Any,
+    page_index: int,
+    min_size: Tuple[int, int],
+    out_dir: Path,
+    stem: str,
+) -> List[Path]:
+    """Save the images of one page that exceed the minimum size."""
+    page = doc[page_index]
+    saved: List[Path] = []
+    min_w, min_h = min_size
+
+    for img_index, img in enumerate(page.get_images(full=True)):
+        # (xref, smask, width, height, ...): skip small images without decoding them
+        xref, width, height = img[0], img[2], img[3]
+        if width < min_w or height < min_h:
+            continue
+
+        img_dict = doc.extract_image(xref)
+        image_bytes: bytes = img_dict["image"]
+        ext = img_dict.get("ext", "png")
+        filename = f"{stem}_p{page_index+1}_i{img_index+1}.{ext}"
+        out_path = out_dir / filename
+        out_path.write_bytes(image_bytes)
+        saved.append(out_path)
+
+    return saved
+
+
+def _init_pdf_worker(path_str: str) -> None:
+    """Open the PDF once per worker process (MuPDF documents are not picklable)."""
+    global _worker_doc, _worker_release
+    _worker_doc, _worker_release = _open_pdf_document(Path(path_str))
+
+
+def _extract_page_images(
+    page_index: int, min_size: Tuple[int, int], out_dir: Path, stem: str
+) -> List[Path]:
+    return _save_page_images(_worker_doc, page_index, min_size, out_dir, stem)
+
+
+def _extract_page_text(page_index: int) -> str:
+    return _worker_doc[page_index].get_text()
+
+
 def extract_images_from_pdf(
     path: str | Path,
     output_dir: Optional[Path] = None,
     min_size: Tuple[int, int] = (500, 500),
+    max_workers: Optional[int] = None,
 ) -> List[Path]:
     """
     Extract and save images from a PDF that exceed a minimum size.
 
+    Pages are decoded in parallel by a process pool; PDFs with fewer than
+    `PARALLEL_MIN_PAGES` pages (or `max_workers=1`) are handled inline.
+
     Args:
         path: input PDF path.
         output_dir: folder where images will be saved (defaults to `<stem>_images`).
         min_size: (width, height) threshold; images smaller than this are skipped.
+        max_workers: process count (defaults to the number of CPUs).
 
     Returns:
-        List of saved image paths.
+        List of saved image paths, in page order.
     """
     input_path = Path(path)
     if not input_path.exists():
@@ -187,33 +414,80 @@ def extract_images_from_pdf(
     out_dir = output_dir or input_path.parent / f"{input_path.stem}_images"
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    doc = fitz.open(str(input_path))  # type: ignore[attr-defined]
-    saved: List[Path] = []
-    min_w, min_h = min_size
+    with open_pdf(input_path) as doc:
+        page_count = len(doc)
+        workers = min(max_workers or os.cpu_count() or 1, page_count)
+        if workers <= 1 or page_count < PARALLEL_MIN_PAGES:
+            saved: List[Path] = []
+            for page_index in range(page_count):
+                saved.extend(
+                    _save_page_images(
+                        doc, page_index, min_size, out_dir, input_path.stem
+                    )
+                )
+            return saved
+
+    worker = partial(
+        _extract_page_images,
+        min_size=min_size,
+        out_dir=out_dir,
+        stem=input_path.stem,
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_POOL_CONTEXT,
+        initializer=_init_pdf_worker,
+        initargs=(str(input_path),),
+    ) as pool:
+        chunksize = max(1, page_count // (workers * 4))
+        results = pool.map(worker, range(page_count), chunksize=chunksize)
+        return [p for page_paths in results for p in page_paths]
+
+
+@contextmanager
+def iter_pdf_page_texts(
+    path: str | Path, max_workers: Optional[int] = None
+) -> Iterator[Iterator[str]]:
+    """
+    Yield an iterator over the text of each PDF page, in page order.
 
-    for page_index in range(len(doc)):
-        page = doc[page_index]
-        for img_index, img in enumerate(page.get_images(full=True)):
-            xref = img[0]
-            img_dict = doc.extract_image(xref)
-            width = img_dict.get("width", 0)
-            height = img_dict.get("height", 0)
-            if width < min_w or height < min_h:
-                continue
-
-            image_bytes: bytes = img_dict["image"]
-            ext = img_dict.get("ext", "png")
-            filename = f"{input_path.stem}_p{page_index+1}_i{img_index+1}.{ext}"
-            out_path = out_dir / filename
-            out_path.write_bytes(image_bytes)
-            saved.append(out_path)
+    Text extraction runs in a process pool (each worker opens the PDF once),
+    so the caller can consume pages while later ones are still being parsed.
+    PDFs with fewer than `TEXT_PARALLEL_MIN_PAGES` pages (or `max_workers=1`)
+    are read inline, which is the common case. Leaving the context cancels pages not yet extracted.
 
-    return saved
+    Args:
+        path: input PDF path.
+        max_workers: process count (defaults to min(CPUs, TEXT_MAX_WORKERS)).
+    """
+    input_path = Path(path)
+    with open_pdf(input_path) as doc:
+        page_count = len(doc)
+        workers = min(
+            max_workers or min(os.cpu_count() or 1, TEXT_MAX_WORKERS), page_count
+        )
+        if workers <= 1 or page_count < TEXT_PARALLEL_MIN_PAGES:
+            yield (doc[i].get_text() for i in range(page_count))
+            return
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_POOL_CONTEXT,
+        initializer=_init_pdf_worker,
+        initargs=(str(input_path),),
+    )
+    try:
+        yield pool.map(_extract_page_text, range(page_count))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 __all__ = [
     "convert_pptx_to_pdf",
+    "convert_pptx_to_pdf_batch",
     "pptx_to_pdf_with_powerpoint",
     "convert_epub_to_text",
     "extract_images_from_pdf",
+    "iter_pdf_page_texts",
+    "open_pdf",
 ]
@@ -9,10 +9,15 @@ Orchestra il processo di lettura documenti:
 """
 
 import base64
-import json
+import hashlib
 import logging
+import queue
+import re
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
 
 import fitz  # type: ignore[import-untyped]  # PyMuPDF
 
@@ -21,29 +26,82 @@ from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage
 
 # Moduli interni
-from src.core.config import OLLAMA_BASE_URL, OLLAMA_MODELS
-from src.core.prompt_manager import PromptManager
+from src.core.config import (
+    OLLAMA_BASE_URL,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_MODELS,
+    OLLAMA_NUM_PARALLEL,
+    OLLAMA_REQUEST_TIMEOUT,
+)
+from src.core.json_codec import (
+    JSONDecodeError,
+    dumps as json_dumps,
+    loads as json_loads,
+)
+from src.core.prompt_manager import prompt_manager
 from src.graph.db_connector import graph_db
 from src.ingestion.bibliographer import (
     bibliographer,
     calculate_trust_score,
     find_doi,
 )
-from src.ingestion.converters import pptx_to_pdf_with_powerpoint
+from src.ingestion.converters import (
+    iter_pdf_page_texts,
+    open_pdf,
+    pptx_to_pdf_with_powerpoint,
+)
 
 # Configurazione Logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-prompts = PromptManager()
+prompts = prompt_manager
 MAX_CONTENT_CHARS = 15000  # Llama 3.x supports large context; keep ample headroom
+# Le chiamate LLM per pagina sono I/O-bound su Ollama: bastano i thread, e il
+# loro numero va scalato sul parallelismo del server, non sulle CPU locali
+DEFAULT_NUM_WORKERS = OLLAMA_NUM_PARALLEL
+VISION_MAX_WORKERS = OLLAMA_NUM_PARALLEL
+VISION_CACHE_SIZE = 1024  # descrizioni memorizzate per hash del contenuto
+VISION_MAX_SIDE = 1024  # il modello di visione ridimensiona comunque l'input
+VISION_JPEG_QUALITY = 75
+# Icone, loghi e glifi decorativi non meritano una chiamata al modello di visione
+VISION_MIN_AREA = 10_000  # pixel (es. 100x100)
+VISION_MIN_SIDE = 50
+TRIPLE_FLUSH_SIZE = 500  # triple accumulate tra pagine prima di scrivere su Neo4j
+
+TripleKey = Tuple[str, str, str]  # (soggetto, predicato, oggetto) normalizzati
+
+# Recupero di triple da output JSON malformato/troncato (stringhe con escape)
+_JSON_STR = r'"((?:[^"\\]|\\.)*)"'
+_TRIPLE_RE = re.compile(
+    r'\{\s*"subject"\s*:\s*' + _JSON_STR
+    + r'\s*,\s*"predicate"\s*:\s*' + _JSON_STR
+    + r'\s*,\s*"object"\s*:\s*' + _JSON_STR
+)
+
+
+def _salvage_triples(raw: str) -> List[Dict[str, Any]]:
+    """Estrae con una regex le triple ben formate da una risposta JSON invalida."""
+    triples: List[Dict[str, Any]] = []
+    for match in _TRIPLE_RE.finditer(raw):
+        try:
+            subj, pred, obj = (json_loads(f'"{g}"') for g in match.groups())
+        except JSONDecodeError:
+            continue
+        triples.append({"subject": subj, "predicate": pred, "object": obj})
+    return triples
 
 
 class IngestionPipeline:
     def __init__(self):
-        # Inizializza i modelli Ollama
+        # Inizializza i modelli Ollama. Ogni istanza riusa un solo client HTTP
+        # (connessioni persistenti); keep_alive evita di ricaricare i modelli
         self.vision_model = ChatOllama(
-            model=OLLAMA_MODELS["vision"], base_url=OLLAMA_BASE_URL, temperature=0.1
+            model=OLLAMA_MODELS["vision"],
+            base_url=OLLAMA_BASE_URL,
+            temperature=0.1,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            client_kwargs={"timeout": OLLAMA_REQUEST_TIMEOUT},
         )
         self.extraction_model = ChatOllama(
             model=OLLAMA_MODELS[
@@ -52,11 +110,37 @@ class IngestionPipeline:
             base_url=OLLAMA_BASE_URL,
             temperature=0.0,  # Deterministico per JSON
             format="json",  # Forza output JSON
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            client_kwargs={"timeout": OLLAMA_REQUEST_TIMEOUT},
         )
-
-    def process_document(self, file_path: str, trust_score: float = 0.85):
+        # Prompt fisso risolto una volta sola, fuori dal ciclo per immagine
+        self._visual_prompt = prompts.format("visual_analyst")
+        # Pool dedicato (distinto da quello delle pagine, che vi attende sopra)
+        self._vision_pool = ThreadPoolExecutor(
+            max_workers=VISION_MAX_WORKERS, thread_name_prefix="vision"
+        )
+        # sha256(stream immagine) -> Future della descrizione: loghi e icone ripetuti
+        # (anche in pagine elaborate in parallelo) costano una sola chiamata
+        self._vision_cache: OrderedDict[bytes, Future] = OrderedDict()
+        self._vision_cache_lock = threading.Lock()
+        # Vincoli/indici: senza, ogni MERGE su Concept è una scansione completa
+        graph_db.ensure_schema()
+
+    def process_document(
+        self,
+        file_path: str,
+        trust_score: float = 0.85,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+    ):
         """
         Processa un intero documento (PPTX convertito in PDF) pagina per pagina.
+
+        Pipeline a due livelli: testo (pool di processi solo per PDF molto
+        lunghi) e immagini sono estratti dal thread chiamante (PyMuPDF non è
+        thread-safe), mentre visione ed estrazione triple (chiamate a Ollama)
+        girano su `num_workers` thread. Il salvataggio in Neo4j avviene in un
+        thread dedicato, nell'ordine delle pagine, in parallelo alle pagine
+        successive.
         """
         path = Path(file_path)
         if path.suffix.lower() == ".pptx":
@@ -68,60 +152,134 @@ class IngestionPipeline:
 
         logger.info(f"📄 Inizio processamento: {path.name} (Trust: {trust_score})")
 
-        # PyMuPDF lacks type hints; treat as dynamic object
-        doc = fitz.open(str(path))  # type: ignore[attr-defined]
-
-        # Trust scoring dinamico (sovrascrive l'eventuale trust passato)
-        text_sample = self._get_text_sample(doc)
-        doi = find_doi(text_sample)
-        trust_score, trust_meta = calculate_trust_score(
-            text_sample,
-            doi=doi,
-            classifier=self.extraction_model,
-        )
-        # Ulteriore valutazione basata su OpenAlex / doc_type rilevato
-        doc_type_detected = trust_meta.get("doc_type") or "Paper"
-        biblio_score = bibliographer.get_trust_score(path.stem, doc_type_detected)
-        trust_score = max(trust_score, biblio_score)
-        logger.info(
-            "🔎 Trust calcolato: %.2f (fonte: %s, dettagli: %s)",
-            trust_score,
-            trust_meta.get("source"),
-            {k: v for k, v in trust_meta.items() if k != "source"},
-        )
+        # Il testo delle pagine si consuma in ordine di pagina (per documenti
+        # molto lunghi è estratto da un pool di processi già durante il trust
+        # scoring, vedi iter_pdf_page_texts)
+        with open_pdf(path) as doc, iter_pdf_page_texts(path) as page_texts:
+            # Trust scoring dinamico (sovrascrive l'eventuale trust passato)
+            text_sample = self._get_text_sample(doc)
+            doi = find_doi(text_sample)
+            # Il lookup OpenAlex procede in parallelo a citazioni/classificazione LLM
+            openalex_lookup = bibliographer.prefetch_openalex(path.stem)
+            trust_score, trust_meta = calculate_trust_score(
+                text_sample,
+                doi=doi,
+                classifier=self.extraction_model,
+            )
+            # Ulteriore valutazione basata su OpenAlex / doc_type rilevato
+            doc_type_detected = trust_meta.get("doc_type") or "Paper"
+            openalex_lookup.result()
+            biblio_score = bibliographer.get_trust_score(path.stem, doc_type_detected)
+            trust_score = max(trust_score, biblio_score)
+            logger.info(
+                "🔎 Trust calcolato: %.2f (fonte: %s, dettagli: %s)",
+                trust_score,
+                trust_meta.get("source"),
+                {k: v for k, v in trust_meta.items() if k != "source"},
+            )
 
-        # Creiamo il nodo Documento nel grafo
-        self._create_document_node(path.name, trust_score)
+            # Creiamo il nodo Documento nel grafo
+            self._create_document_node(path.name, trust_score)
 
-        for page_num in range(len(doc)):
-            page = cast(Any, doc[page_num])
-            logger.info(f"  -- Elaborazione pagina {page_num + 1}/{len(doc)}...")
+            # Al massimo 2 pagine per worker in volo: limita la RAM delle immagini
+            max_in_flight = 2 * max(1, num_workers)
+            # 5. Salvataggio nel Grafo: un thread dedicato consuma le triple
+            # delle pagine (in ordine) e scrive a blocchi
+            triples_queue: queue.Queue[Optional[List[Dict]]] = queue.Queue(
+                maxsize=max_in_flight
+            )
+            writer = threading.Thread(
+                target=self._writer_loop,
+                args=(triples_queue, path.name),
+                name="graph-writer",
+                daemon=True,
+            )
+            writer.start()
+            try:
+                self._run_pages(
+                    doc, page_texts, triples_queue, num_workers, max_in_flight
+                )
+            finally:
+                triples_queue.put(None)  # sentinella: svuota e termina
+                writer.join()
 
-            # 1. Estrai Testo
-            text_content = page.get_text()
+        logger.info(f"✅ Processamento completato: {path.name}")
 
-            # 2. Estrai e Analizza Immagini
-            image_descriptions = self._analyze_page_images(page)
+    def _run_pages(
+        self,
+        doc,
+        page_texts,
+        triples_queue: "queue.Queue[Optional[List[Dict]]]",
+        num_workers: int,
+        max_in_flight: int,
+    ) -> None:
+        """Estrae immagini e avvia l'analisi delle pagine, accodando le triple."""
+        page_count = len(doc)
+        in_flight: Deque[Future] = deque()
+        with ThreadPoolExecutor(
+            max_workers=max(1, num_workers), thread_name_prefix="ingest-page"
+        ) as pool:
+            pages = zip(doc, page_texts)
+            for page_num, (page, text_content) in enumerate(pages):
+                logger.info(f"  -- Elaborazione pagina {page_num + 1}/{page_count}...")
+
+                # 1-2. Testo e Immagini (PyMuPDF, thread chiamante); la visione
+                # parte subito sul pool dedicato, solo per immagini non in cache
+                images = self._extract_page_images(page)
+
+                # 3-4. Sintesi + Estrazione Conoscenza (Ollama, worker)
+                in_flight.append(pool.submit(self._analyze_page, text_content, images))
+                if len(in_flight) >= max_in_flight:
+                    # Bloccante se il writer è indietro: contropressione
+                    triples_queue.put(in_flight.popleft().result())
+
+            while in_flight:
+                triples_queue.put(in_flight.popleft().result())
+
+    def _analyze_page(
+        self, text_content: str, images: List[Tuple[int, Future]]
+    ) -> List[Dict]:
+        """Descrive le figure e estrae le triple di una pagina (eseguito nei worker)."""
+        image_descriptions = self._describe_images(images)
+
+        # 3. Sintesi del contenuto (Testo + Visione)
+        full_page_content = (
+            f"TESTO:\n{text_content}\n\nDESCRIZIONE FIGURE:\n{image_descriptions}"
+        )
 
-            # 3. Sintesi del contenuto (Testo + Visione)
-            full_page_content = (
-                f"TESTO:\n{text_content}\n\nDESCRIZIONE FIGURE:\n{image_descriptions}"
-            )
+        # 4. Estrazione Conoscenza (Triple)
+        return self._extract_knowledge(full_page_content)
 
-            # 4. Estrazione Conoscenza (Triple)
-            knowledge = self._extract_knowledge(full_page_content)
+    def _writer_loop(
+        self, triples_queue: "queue.Queue[Optional[List[Dict]]]", source_file: str
+    ) -> None:
+        """
+        Consuma le triple delle pagine e le scrive in Neo4j (thread dedicato).
 
-            # 5. Salvataggio nel Grafo
-            if knowledge:
-                self._save_to_graph(knowledge, source_file=path.name)
+        Le triple distinte sono accumulate con il numero di occorrenze e
+        scritte solo ogni TRIPLE_FLUSH_SIZE (il ciclo pagine non attende
+        comunque le scritture); `None` chiude il ciclo dopo l'ultima scrittura.
+        """
+        pending: Counter[TripleKey] = Counter()
+        while True:
+            page_triples = triples_queue.get()
+            if page_triples is None:
+                break
+
+            pending.update(
+                (t["subject"], t["predicate"], t["object"]) for t in page_triples
+            )
+            if len(pending) >= TRIPLE_FLUSH_SIZE:
+                self._save_to_graph(pending, source_file=source_file)
+                pending.clear()
 
-        logger.info(f"✅ Processamento completato: {path.name}")
+        if pending:
+            self._save_to_graph(pending, source_file=source_file)
 
     def _get_text_sample(self, doc, max_pages: int = 3) -> str:
         """Estrae il testo dalle prime pagine per stima fiducia."""
         texts = []
-        for idx in range(min(len(doc), max_pages)):
-            page = doc[idx]
+        for idx, page in zip(range(max_pages), doc):
             try:
                 texts.append(page.get_text())
             except Exception as exc:
@@ -130,37 +288,112 @@ class IngestionPipeline:
                 )
         return "\n\n".join(texts)
 
-    def _analyze_page_images(self, page) -> str:
-        """Estrae immagini dalla pagina e chiede a Llama Vision di descriverle."""
+    def _extract_page_images(self, page) -> List[Tuple[int, Future]]:
+        """
+        Avvia la descrizione delle immagini della pagina: (indice, Future).
+
+        La cache è indicizzata sullo stream grezzo (ancora compresso) dell'immagine,
+        così loghi e figure ripetuti non vengono nemmeno decodificati: la
+        conversione in JPEG avviene solo alla prima occorrenza.
+        """
+        doc = page.parent
+        images: List[Tuple[int, Future]] = []
+        for img_index, img in enumerate(page.get_images(full=True)):
+            # (xref, smask, width, height, ...): filtra prima di decodificare
+            xref, width, height = img[0], img[2], img[3]
+            if width * height < VISION_MIN_AREA or min(width, height) < VISION_MIN_SIDE:
+                continue
+            try:
+                key = hashlib.sha256(doc.xref_stream_raw(xref)).digest()
+            except Exception as exc:
+                logger.debug("Stream non disponibile per xref %s: %s", xref, exc)
+                image_bytes = self._render_image(doc, xref)
+                key = hashlib.sha256(image_bytes).digest()
+                future = self._describe_image_async(key, lambda: image_bytes)
+            else:
+                future = self._describe_image_async(
+                    key, lambda: self._render_image(doc, xref)
+                )
+            images.append((img_index, future))
+        return images
+
+    def _render_image(self, doc, xref: int) -> bytes:
+        """JPEG ridotto dell'immagine, o i bytes originali se il Pixmap fallisce."""
+        try:
+            return self._image_to_jpeg(doc, xref)
+        except Exception as exc:
+            logger.debug("Pixmap non disponibile per xref %s: %s", xref, exc)
+            return doc.extract_image(xref)["image"]
+
+    def _image_to_jpeg(self, doc, xref: int) -> bytes:
+        """
+        Renderizza l'immagine `xref` come JPEG RGB ridotto a `VISION_MAX_SIDE`.
+
+        Payload più piccoli verso Ollama e niente PNG grandi da ricodificare.
+        """
+        pix = fitz.Pixmap(doc, xref)
+        if pix.n - pix.alpha >= 4:  # CMYK e simili -> RGB
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+        if pix.alpha:  # il JPEG non supporta il canale alpha
+            pix = fitz.Pixmap(pix, 0)
+
+        shrink = 0
+        while max(pix.width, pix.height) >> shrink > VISION_MAX_SIDE:
+            shrink += 1
+        if shrink:
+            pix.shrink(shrink)  # divide i lati per 2**shrink
+
+        return pix.tobytes("jpeg", jpg_quality=VISION_JPEG_QUALITY)
+
+    def _describe_images(self, images: List[Tuple[int, Future]]) -> str:
+        """Raccoglie le descrizioni di Llama Vision (richieste già avviate)."""
         descriptions = []
-        image_list = page.get_images(full=True)
-
-        for img_index, img in enumerate(image_list):
-            xref = img[0]
-            base_image = page.parent.extract_image(xref)
-            image_bytes = base_image["image"]
-
-            # Converti in base64 per Ollama
-            img_b64 = base64.b64encode(image_bytes).decode("utf-8")
-
-            # Chiedi a Llama Vision
-            msg = HumanMessage(
-                content=[
-                    {"type": "text", "text": prompts.get("visual_analyst")},
-                    {
-                        "type": "image_url",
-                        "image_url": {"url": f"data:image/jpeg;base64,{img_b64}"},
-                    },
-                ]
-            )
+        for img_index, future in images:
             try:
-                response = self.vision_model.invoke([msg])
-                descriptions.append(f"[Figura {img_index+1}]: {response.content}")
+                descriptions.append(f"[Figura {img_index+1}]: {future.result()}")
             except Exception as e:
                 logger.warning(f"Errore visione immagine {img_index}: {e}")
 
         return "\n".join(descriptions)
 
+    def _describe_image_async(self, key: bytes, render: Callable[[], bytes]) -> Future:
+        """
+        Restituisce la descrizione in cache per `key` o la richiede.
+
+        `render` produce l'immagine solo in caso di miss; va chiamato dal thread
+        che legge il PDF (PyMuPDF non è thread-safe), unico chiamante di questo
+        metodo.
+        """
+        with self._vision_cache_lock:
+            future = self._vision_cache.get(key)
+            # Le richieste fallite non restano in cache
+            if future is not None and not (future.done() and future.exception()):
+                self._vision_cache.move_to_end(key)
+                return future
+
+        image_bytes = render()
+        with self._vision_cache_lock:
+            future = self._vision_pool.submit(self._describe_image, image_bytes)
+            self._vision_cache[key] = future
+            while len(self._vision_cache) > VISION_CACHE_SIZE:
+                self._vision_cache.popitem(last=False)
+            return future
+
+    def _describe_image(self, image_bytes: bytes) -> Any:
+        # Converti in base64 per Ollama. langchain-ollama accetta anche il base64
+        # nudo: senza il prefisso "data:" si evitano la concatenazione e lo
+        # split successivo, due copie in più dell'intero payload
+        img_b64 = base64.b64encode(image_bytes).decode("ascii")
+
+        # Chiedi a Llama Vision
+        msg = HumanMessage(
+            content=[
+                {"type": "text", "text": self._visual_prompt},
+                {"type": "image_url", "image_url": img_b64},
+            ]
+        )
+        return self.vision_model.invoke([msg]).content
+
     def _extract_knowledge(self, content: str) -> List[Dict]:
         """Usa LLM per estrarre triple JSON dal contenuto misto."""
         if len(content.strip()) < 50:
@@ -174,28 +407,38 @@ class IngestionPipeline:
             response = self.extraction_model.invoke(prompt)
             raw_content: Any = getattr(response, "content", response)
             content_str = (
-                raw_content if isinstance(raw_content, str) else json.dumps(raw_content)
+                raw_content if isinstance(raw_content, str) else json_dumps(raw_content)
             )
-            data = json.loads(content_str)
             triples: List[Dict[str, Any]] = []
+            try:
+                data = json_loads(content_str)
+            except JSONDecodeError:
+                # Recupero parziale: evita di perdere l'intera pagina
+                triples = _salvage_triples(content_str)
+                logger.warning(
+                    "Errore decoding JSON da LLM, recuperate %d triple", len(triples)
+                )
+                data = None
             if isinstance(data, dict) and isinstance(data.get("triples"), list):
                 triples = [t for t in data.get("triples", []) if isinstance(t, dict)]
             elif isinstance(data, list):
                 triples = [t for t in data if isinstance(t, dict)]
 
+            # Normalizzazione una sola volta: la scrittura si limita al binding
             normalized: List[Dict[str, Any]] = []
             for t in triples:
                 subj = t.get("subject") or t.get("s") or t.get("subj")
                 pred = t.get("predicate") or t.get("p") or t.get("pred")
                 obj = t.get("object") or t.get("o") or t.get("obj")
+                if not (subj and pred and obj):
+                    continue
+                subj, obj = str(subj).strip(), str(obj).strip()
+                pred = str(pred).strip().upper().replace(" ", "_")
                 if subj and pred and obj:
                     normalized.append(
-                        {"subject": str(subj), "predicate": str(pred), "object": str(obj)}
+                        {"subject": subj, "predicate": pred, "object": obj}
                     )
             return normalized
-        except json.JSONDecodeError:
-            logger.error("Errore decoding JSON da LLM")
-            return []
         except Exception as e:
             logger.error(f"Errore estrazione: {e}")
             return []
@@ -207,37 +450,43 @@ class IngestionPipeline:
         """
         graph_db.query(query, {"name": filename, "trust": trust})
 
-    def _save_to_graph(self, triples: List[Dict], source_file: str):
-        """Salva le triple in Neo4j collegandole al documento."""
-        for triple in triples:
-            if not all(k in triple for k in ("subject", "predicate", "object")):
-                logger.warning("Tripla incompleta, salto: %s", triple)
-                continue
-            # Cypher query per inserire o aggiornare nodi e relazioni
-            query = """
-            MATCH (doc:Document {name: $source})
-            
-            MERGE (s:Concept {name: $subj})
-            MERGE (o:Concept {name: $obj})
-            
-            MERGE (s)-[r:RELATION {type: $pred}]->(o)
-            
-            // Aggiornamento Bayesiano semplificato (Media pesata)
-            ON CREATE SET r.weight = doc.trust_score, r.sources = [doc.name]
-            ON MATCH SET r.weight = (r.weight + doc.trust_score) / 2, 
-                         r.sources = r.sources + [doc.name]
-            """
-            params = {
-                "source": source_file,
-                "subj": triple["subject"],
-                "pred": triple["predicate"].upper().replace(" ", "_"),
-                "obj": triple["object"],
-            }
-            try:
-                graph_db.query(query, params)
-            except Exception as e:
-                logger.error(f"Errore salvataggio tripla {triple}: {e}")
-
+    def _save_to_graph(self, triples: Mapping[TripleKey, int], source_file: str):
+        """
+        Salva le triple distinte in Neo4j collegandole al documento (una query
+        UNWIND); `triples` associa ogni tripla al numero di occorrenze.
+        """
+        rows = [
+            {"subj": subj, "pred": pred, "obj": obj, "count": count}
+            for (subj, pred, obj), count in triples.items()
+        ]
+        if not rows:
+            return
+
+        # Cypher query per inserire o aggiornare nodi e relazioni
+        query = """
+        MATCH (doc:Document {name: $source})
+        UNWIND $rows AS row
+
+        MERGE (s:Concept {name: row.subj})
+        MERGE (o:Concept {name: row.obj})
+
+        MERGE (s)-[r:RELATION {type: row.pred}]->(o)
+
+        // Aggiornamento Bayesiano semplificato (Media pesata sulle occorrenze;
+        // le relazioni create prima del conteggio valgono un'occorrenza)
+        ON CREATE SET r.weight = doc.trust_score, r.count = row.count,
+                      r.sources = [doc.name]
+        ON MATCH SET r.weight = (r.weight * coalesce(r.count, 1)
+                                 + doc.trust_score * row.count)
+                                / (coalesce(r.count, 1) + row.count),
+                     r.count = coalesce(r.count, 1) + row.count,
+                     r.sources = CASE WHEN doc.name IN r.sources THEN r.sources
+                                      ELSE r.sources + [doc.name] END
+        """
+        try:
+            graph_db.bulk_write(query, rows, {"source": source_file})
+        except Exception as e:
+            logger.error(f"Errore salvataggio di {len(rows)} triple: {e}")
 
 # Istanza globale
 ingestor = IngestionPipeline()
@@ -12,10 +12,14 @@ import streamlit as st
 
 from src.graph.db_connector import graph_db
 
-PAGE_LIMIT = 200
+PAGE_SIZE = 50
+CACHE_TTL = 30  # secondi
 
 
-def fetch_provisional_triples(limit: int = PAGE_LIMIT) -> List[Dict[str, Any]]:
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_provisional_triples(
+    page: int = 0, limit: int = PAGE_SIZE
+) -> List[Dict[str, Any]]:
     query = """
     MATCH (s)-[r:RELATION]->(o)
     WHERE coalesce(r.status, 'PROVISIONAL') = 'PROVISIONAL'
@@ -27,9 +31,10 @@ def fetch_provisional_triples(limit: int = PAGE_LIMIT) -> List[Dict[str, Any]]:
            r.weight AS weight,
            r.sources AS sources
     ORDER BY rel_id DESC
+    SKIP $offset
     LIMIT $limit
     """
-    return graph_db.query(query, {"limit": limit})
+    return graph_db.query(query, {"offset": page * limit, "limit": limit})
 
 
 def commit_triples(rows: List[Dict[str, Any]]) -> int:
@@ -64,27 +69,31 @@ def main() -> None:
     st.title("✅ Validator")
     st.caption("Rivedi le triple estratte e valida quelle corrette.")
 
+    page = st.number_input("Pagina", min_value=1, value=1, step=1)
+
     with st.spinner("Caricamento triple provvisorie..."):
-        triples = fetch_provisional_triples()
+        triples = fetch_provisional_triples(int(page) - 1)
 
     if not triples:
-        st.success("Nessuna tripla in attesa di validazione.")
+        if page > 1:
+            st.info("Nessuna tripla in questa pagina.")
+        else:
+            st.success("Nessuna tripla in attesa di validazione.")
         return
 
-    data = []
-    for row in triples:
-        data.append(
-            {
-                "selected": True,
-                "rel_id": row.get("rel_id"),
-                "subject": row.get("subject", ""),
-                "predicate": row.get("predicate", ""),
-                "object": row.get("object", ""),
-                "status": row.get("status", "PROVISIONAL"),
-                "weight": row.get("weight"),
-                "sources": row.get("sources"),
-            }
-        )
+    data = [
+        {
+            "selected": True,
+            "rel_id": row.get("rel_id"),
+            "subject": row.get("subject", ""),
+            "predicate": row.get("predicate", ""),
+            "object": row.get("object", ""),
+            "status": row.get("status", "PROVISIONAL"),
+            "weight": row.get("weight"),
+            "sources": row.get("sources"),
+        }
+        for row in triples
+    ]
 
     edited = st.data_editor(
         data,
@@ -95,7 +104,7 @@ def main() -> None:
             "rel_id": st.column_config.Column("Rel ID", disabled=True),
             "status": st.column_config.Column("Stato", disabled=True),
         },
-        key="validator_editor",
+        key=f"validator_editor_{page}",  # stato editor separato per pagina
     )
 
     if st.button("Commit selezionati"):
@@ -115,6 +124,7 @@ def main() -> None:
             return
 
         updated = commit_triples(selected)
+        fetch_provisional_triples.clear()
         st.success(f"Confermate {updated} relazioni.")
         st.experimental_rerun()
 
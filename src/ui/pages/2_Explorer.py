@@ -6,15 +6,80 @@ Semantic search + graph visualization using streamlit-agraph.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List
 
 import streamlit as st
 from streamlit_agraph import agraph, Node, Edge, Config
 
-from src.graph.db_connector import graph_db
+from src.graph.db_connector import CONCEPT_FULLTEXT_INDEX, graph_db
 
+logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\w+")
+
+# Colore per etichetta (maiuscolo); in caso di più etichette vince la prima
+COLOR_BY_LABEL: Dict[str, str] = {
+    "ANATOMIA": "#ff7f0e",
+    "ANATOMY": "#ff7f0e",
+    "MOLECOLA": "#1f77b4",
+    "MOLECULE": "#1f77b4",
+    "PATOLOGIA": "#d62728",
+    "PATHOLOGY": "#d62728",
+}
+DEFAULT_NODE_COLOR = "#7f7f7f"
+
+SEARCH_CACHE_TTL = 60  # secondi
+SEARCH_CACHE_ENTRIES = 128
+
+
+def to_fulltext_query(query: str) -> str:
+    """
+    Converte il testo utente in una query Lucene: prefisso su ogni parola (AND).
+
+    I termini con wildcard non passano dall'analyzer: si usano quindi gli stessi
+    token dell'indice ("5-HT" -> "5* AND ht*"), già privi di caratteri speciali.
+    """
+    return " AND ".join(f"{token}*" for token in _WORD_RE.findall(query.lower()))
+
+
+@st.cache_data(
+    ttl=SEARCH_CACHE_TTL, max_entries=SEARCH_CACHE_ENTRIES, show_spinner=False
+)
 def semantic_search(query: str) -> List[Dict[str, Any]]:
+    return _semantic_search(query)
+
+
+def _semantic_search(query: str) -> List[Dict[str, Any]]:
+    cypher = f"""
+    CALL db.index.fulltext.queryNodes('{CONCEPT_FULLTEXT_INDEX}', $q)
+    YIELD node AS c, score
+    OPTIONAL MATCH (c)-[r:RELATION]->(t:Concept)
+    RETURN c.name AS source,
+           labels(c) AS source_labels,
+           t.name AS target,
+           labels(t) AS target_labels,
+           r.type AS rel_type,
+           r.weight AS weight
+    ORDER BY score DESC
+    LIMIT 200
+    """
+    fulltext_query = to_fulltext_query(query)
+    if not fulltext_query:  # solo punteggiatura: nessun token da cercare
+        return substring_search(query)
+    try:
+        rows = graph_db.query(cypher, {"q": fulltext_query})
+    except Exception as exc:
+        # Indice full-text assente (schema non ancora creato): scansione lineare
+        logger.warning("Ricerca full-text non disponibile, uso CONTAINS: %s", exc)
+        return substring_search(query)
+    # Nessun risultato per token: la sottostringa può comunque trovare qualcosa
+    return rows or substring_search(query)
+
+
+def substring_search(query: str) -> List[Dict[str, Any]]:
     cypher = """
     MATCH (c:Concept)
     WHERE toLower(c.name) CONTAINS toLower($q)
@@ -30,15 +95,13 @@ def semantic_search(query: str) -> List[Dict[str, Any]]:
     return graph_db.query(cypher, {"q": query})
 
 
-def color_for_labels(labels: List[str]) -> str:
-    labels_upper = {label.upper() for label in labels}
-    if "ANATOMIA" in labels_upper or "ANATOMY" in labels_upper:
-        return "#ff7f0e"
-    if "MOLECOLA" in labels_upper or "MOLECULE" in labels_upper:
-        return "#1f77b4"
-    if "PATOLOGIA" in labels_upper or "PATHOLOGY" in labels_upper:
-        return "#d62728"
-    return "#7f7f7f"
+@lru_cache(maxsize=128)
+def color_for_labels(labels_key: FrozenSet[str]) -> str:
+    labels_upper = {label.upper() for label in labels_key}
+    return next(
+        (color for label, color in COLOR_BY_LABEL.items() if label in labels_upper),
+        DEFAULT_NODE_COLOR,
+    )
 
 
 def build_graph(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
@@ -51,11 +114,15 @@ def build_graph(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
         rel = row.get("rel_type")
         if src and src not in nodes:
             nodes[src] = Node(
-                id=src, label=src, color=color_for_labels(row.get("source_labels", []))
+                id=src,
+                label=src,
+                color=color_for_labels(frozenset(row.get("source_labels") or ())),
             )
         if tgt and tgt not in nodes:
             nodes[tgt] = Node(
-                id=tgt, label=tgt, color=color_for_labels(row.get("target_labels", []))
+                id=tgt,
+                label=tgt,
+                color=color_for_labels(frozenset(row.get("target_labels") or ())),
             )
         if src and tgt and rel:
             edges.append(Edge(source=src, target=tgt, label=rel))
@@ -69,10 +136,15 @@ def main() -> None:
     st.caption("Cerca concetti e visualizza il grafo.")
 
     query = st.text_input("Ricerca semantica", "")
+    refresh = st.checkbox(
+        "Aggiorna risultati", help="Ignora i risultati in cache e rilegge dal grafo."
+    )
 
     if st.button("Cerca") and query.strip():
+        # "Aggiorna" interroga direttamente il grafo, senza toccare la cache
+        search = _semantic_search if refresh else semantic_search
         with st.spinner("Ricerca in corso..."):
-            rows = semantic_search(query.strip())
+            rows = search(query.strip())
         if not rows:
             st.info("Nessun risultato trovato.")
             return